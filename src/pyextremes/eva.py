@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import calendar
+import itertools
 import logging
 import typing
 import warnings
@@ -26,6 +27,38 @@
 logger = logging.getLogger(__name__)
 
 
+def _normalize_return_period(return_period, copy: bool = False) -> np.ndarray:
+    """
+    Convert return period(s) to a 1D float64 array.
+
+    Parameters
+    ----------
+    return_period : array-like
+        Return period or 1D array of return periods.
+    copy : bool, optional
+        If True, the returned array never shares memory with `return_period`.
+        By default False (no copy is made if `return_period` is already
+        a 1D float64 array).
+
+    Returns
+    -------
+    return_period : numpy.ndarray
+        1D float64 array of return periods.
+
+    """
+    return_period = np.asarray(a=return_period, dtype=np.float64)
+    if return_period.ndim == 0:
+        return_period = return_period[np.newaxis]
+    if return_period.ndim != 1:
+        raise ValueError(
+            f"invalid shape in {return_period.shape} "
+            f"for the 'return_period' argument, must be 1D array"
+        )
+    if copy:
+        return_period = return_period.copy()
+    return return_period
+
+
 class EVA:
     """
     Extreme Value Analysis (EVA) class.
@@ -46,21 +79,25 @@ class EVA:
 
     __slots__ = [
         "__data",
+        "__data_span",
         "__extremes",
         "__extremes_method",
         "__extremes_type",
         "__extremes_kwargs",
         "__extremes_transformer",
         "__model",
+        "__observed_return_values_cache",
     ]
 
     __data: pd.Series
+    __data_span: pd.Timedelta
     __extremes: typing.Optional[pd.Series]
     __extremes_method: typing.Optional[typing.Literal["BM", "POT"]]
     __extremes_type: typing.Optional[typing.Literal["high", "low"]]
     __extremes_kwargs: typing.Optional[typing.Dict[str, typing.Any]]
     __extremes_transformer: typing.Optional[ExtremesTransformer]
     __model: typing.Optional[typing.Union[MLE, Emcee]]
+    __observed_return_values_cache: typing.Dict[tuple, pd.DataFrame]
 
     def __init__(self, data: pd.Series) -> None:
         """
@@ -80,8 +117,10 @@ def __init__(self, data: pd.Series) -> None:
                 f"must be pandas.Series"
             )
 
-        # Copy `data` to ensure the original Series object it is not mutated
-        data = data.copy(deep=True)
+        # Track whether `data` still shares its values or index with the original
+        # Series object (set by cleaning steps which create both values and index
+        # anew - 'astype' is not one of them as it reuses the original index)
+        is_copy = False
 
         # Ensure that `data` has correct index and value dtypes
         if not np.issubdtype(data.dtype, np.number):
@@ -110,6 +149,7 @@ def __init__(self, data: pd.Series) -> None:
             logger.debug(message)
             warnings.warn(message=message, category=RuntimeWarning)
             data = data.groupby(data.index).first()
+            is_copy = True
 
         # Ensure that `data` is sorted
         if not data.index.is_monotonic_increasing:
@@ -120,20 +160,30 @@ def __init__(self, data: pd.Series) -> None:
             logger.debug(message)
             warnings.warn(message=message, category=RuntimeWarning)
             data = data.sort_index(ascending=True)
+            is_copy = True
 
         # Ensure that `data` has no invalid entries
-        n_nans = data.isna().sum()
-        if n_nans > 0:
+        if data.hasnans:
+            n_nans = data.isna().sum()
             message = (
                 f"{n_nans:,d} Null values found in `data` - removing invalid entries"
             )
             logger.debug(message)
             warnings.warn(message=message, category=RuntimeWarning)
             data = data.dropna()
+            is_copy = True
+
+        # Copy `data` to ensure the original Series object is not mutated
+        # (skipped if one of the cleaning steps above already created a full copy)
+        if not is_copy:
+            data = data.copy(deep=True)
 
         # Set the `data` attribute
         self.__data: pd.Series = data
 
+        # Set the time span covered by `data` (used to calculate extremes rate)
+        self.__data_span: pd.Timedelta = data.index.max() - data.index.min()
+
         # Initialize attributes related to extreme value extraction
         self.__extremes = None
         self.__extremes_method = None
@@ -144,6 +194,10 @@ def __init__(self, data: pd.Series) -> None:
         # Initialize attributes related to model fitting
         self.__model = None
 
+        # Initialize cache of observed return values
+        # (see '_get_observed_return_values')
+        self.__observed_return_values_cache = {}
+
         logger.info("successfully initialized EVA object")
 
     @property
@@ -230,6 +284,10 @@ def __repr__(self) -> str:
         # Width of repr block
         width = 88
 
+        # Horizontal lines used to separate sections of the repr block
+        double_line = "=" * width
+        single_line = "-" * width
+
         # Separator used to separate two columns of the repr block
         sep = " " * 6
 
@@ -261,18 +319,9 @@ def align_text(label: str, value: str, position: str) -> typing.List[str]:
 
             # Collect text row-by-row using 'value_chunks'
             aligned_text = [f"{label}: {value_chunks[0]:>{free_width}}"]
-            try:
-                for chunk in value_chunks[1:]:
-                    aligned_text.append(
-                        "".join(
-                            [
-                                " " * label_width,
-                                f"{chunk:>{free_width}}",
-                            ]
-                        )
-                    )
-            except IndexError:
-                pass
+            aligned_text.extend(
+                f"{'':{label_width}}{chunk:>{free_width}}" for chunk in value_chunks[1:]
+            )
             return aligned_text
 
         # Function used to convert two label-value pairs
@@ -285,12 +334,15 @@ def align_pair(
                 align_text(lbl, val, pos)
                 for lbl, val, pos in zip(label, value, ("left", "right"))
             ]
-            while len(parts[0]) != len(parts[1]):
-                shorter_part_index = 0 if len(parts[0]) < len(parts[1]) else 1
-                parts[shorter_part_index].append(
-                    " " * len(parts[shorter_part_index][0])
+            # Pad the shorter column with blank rows of matching width
+            left_part, right_part = parts
+            left_width, right_width = len(left_part[0]), len(right_part[0])
+            return "\n".join(
+                f"{left:{left_width}}{sep}{right:{right_width}}"
+                for left, right in itertools.zip_longest(
+                    left_part, right_part, fillvalue=""
                 )
-            return "\n".join([sep.join([left, right]) for left, right in zip(*parts)])
+            )
 
         # Create summary header
         start_date = (
@@ -303,9 +355,9 @@ def align_pair(
         )
         summary = [
             "Univariate Extreme Value Analysis".center(width),
-            "=" * width,
+            double_line,
             "Source Data".center(width),
-            "-" * width,
+            single_line,
             align_pair(
                 ("Data label", "Size"),
                 (str(self.data.name), f"{len(self.data):,d}"),
@@ -314,14 +366,14 @@ def align_pair(
                 ("Start", "End"),
                 (start_date, end_date),
             ),
-            "=" * width,
+            double_line,
         ]
 
         # Fill the extremes section
         summary.extend(
             [
                 "Extreme Values".center(width),
-                "-" * width,
+                single_line,
             ]
         )
         try:
@@ -351,13 +403,13 @@ def align_pair(
             )
         except AttributeError:
             summary.append("Extreme values have not been extracted")
-        summary.append("=" * width)
+        summary.append(double_line)
 
         # Fill the model section
         summary.extend(
             [
                 "Model".center(width),
-                "-" * width,
+                single_line,
             ]
         )
         try:
@@ -384,7 +436,7 @@ def align_pair(
                 )
             )
 
-            summary.append("-" * width)
+            summary.append(single_line)
 
             free_parameters = [
                 f"{parameter}={self.model.fit_parameters[parameter]:.3f}"
@@ -423,7 +475,7 @@ def align_pair(
         except AttributeError:
             summary.append("Model has not been fit to the extremes")
 
-        summary.append("=" * width)
+        summary.append(double_line)
 
         return "\n".join(summary)
 
@@ -501,6 +553,7 @@ def get_extremes(
         """
         message = f"for method='{method}' and extremes_type='{extremes_type}'"
         logger.debug("extracting extreme values %s", message)
+        self.__observed_return_values_cache = {}
         self.__extremes = get_extremes(
             method=method,
             ts=self.data,
@@ -722,6 +775,7 @@ def set_extremes(
             extremes_type=self.__extremes_type,
         )
         self.__model = None
+        self.__observed_return_values_cache = {}
         logger.info("successfully set extremes")
 
     @typing.overload
@@ -1234,27 +1288,24 @@ def get_return_value(
         # as number of extreme events per `return_period_size`
         if self.extremes_method == "BM":
             #extremes_rate = return_period_size / self.extremes_kwargs["block_size"]
-            n_periods = (self.data.index[-1] - self.data.index[0]) / return_period_size      # orginal, not account for large break between measurements
+            # `__data_span` is the full time span of `data`, so large gaps
+            # between measurements are not accounted for
+            n_periods = self.__data_span / return_period_size
             extremes_rate = len(self.extremes) / n_periods
             
         elif self.extremes_method == "POT":
-            n_periods = (self.data.index[-1] - self.data.index[0]) / return_period_size
+            n_periods = self.__data_span / return_period_size
             extremes_rate = len(self.extremes) / n_periods
         else:
             raise AssertionError
 
         # Convert 'return_period' to ndarray
-        return_period = np.asarray(a=return_period, dtype=np.float64).copy()
-        if return_period.ndim == 0:
-            return_period = return_period[np.newaxis]
-        if return_period.ndim != 1:
-            raise ValueError(
-                f"invalid shape in {return_period.shape} "
-                f"for the 'return_period' argument, must be 1D array"
-            )
+        return_period = _normalize_return_period(return_period)
 
         # Calculate exceedance probability
-        exceedance_probability = 1 / return_period / extremes_rate
+        # (single allocation, `return_period` is never mutated)
+        exceedance_probability = np.reciprocal(return_period)
+        exceedance_probability /= extremes_rate
 
         # Calculate return values
         return tuple(
@@ -1306,14 +1357,8 @@ def get_summary(
 
         """
         # Convert 'return_period' to ndarray
-        return_period = np.asarray(a=return_period, dtype=np.float64).copy()
-        if return_period.ndim == 0:
-            return_period = return_period[np.newaxis]
-        if return_period.ndim != 1:
-            raise ValueError(
-                f"invalid shape in {return_period.shape} "
-                f"for the 'return_period' argument, must be 1D array"
-            )
+        # (copied because it is used as the index of the returned DataFrame)
+        return_period = _normalize_return_period(return_period, copy=True)
 
         # Calculate return values
         rv = self.get_return_value(
@@ -1329,12 +1374,67 @@ def get_summary(
                 value = value[np.newaxis]
             return_values.append(value)
 
+        # Build the DataFrame column-wise to avoid stacking 'return_values'
         return pd.DataFrame(
-            data=np.transpose(return_values),
-            index=pd.Index(data=return_period, name="return period"),
-            columns=["return value", "lower ci", "upper ci"],
+            data=dict(zip(["return value", "lower ci", "upper ci"], return_values)),
+            index=pd.Index(data=return_period, name="return period", copy=False),
         )
 
+    def _get_observed_return_values(
+        self,
+        return_period_size: typing.Union[str, pd.Timedelta],
+        plotting_position: str,
+    ) -> pd.DataFrame:
+        """
+        Get observed return values, reusing previously calculated results.
+
+        Results depend only on extracted extreme values and the arguments below,
+        so they are cached until extreme values are extracted or set again.
+        The returned DataFrame is shared between calls and must not be mutated.
+
+        Parameters
+        ----------
+        return_period_size : str or pandas.Timedelta
+            Size of return periods.
+        plotting_position : str
+            Plotting position name, not case-sensitive.
+
+        Returns
+        -------
+        observed_return_values : pandas.DataFrame
+            A DataFrame with extreme values, exceedance probabilities,
+            and return periods as multiples of `return_period_size`.
+
+        """
+        # Parse the 'return_period_size' argument
+        # (equal sizes given as str or pandas.Timedelta share one cache entry)
+        if not isinstance(return_period_size, pd.Timedelta):
+            if isinstance(return_period_size, str):
+                return_period_size = pd.to_timedelta(return_period_size)
+            else:
+                raise TypeError(
+                    f"invalid type in {type(return_period_size)} "
+                    f"for the 'return_period_size' argument"
+                )
+
+        key = (return_period_size, str(plotting_position).lower())
+        try:
+            observed_return_values = self.__observed_return_values_cache[key]
+            logger.debug("fetched observed return values for %s from cache", key)
+        except KeyError:
+            observed_return_values = get_return_periods(
+                ts=self.data,
+                extremes=self.extremes,
+                extremes_method=self.extremes_method,
+                extremes_type=self.extremes_type,
+                block_size=self.extremes_kwargs.get("block_size", None),
+                return_period_size=return_period_size,
+                plotting_position=plotting_position,
+            )
+            self.__observed_return_values_cache[key] = observed_return_values
+            logger.debug("calculated observed return values for %s", key)
+        return observed_return_values
+
     def plot_return_values(
         self,
         return_period=None,
@@ -1403,12 +1503,7 @@ def plot_return_values(
 
         """
         # Get observed return values
-        observed_return_values = get_return_periods(
-            ts=self.data,
-            extremes=self.extremes,
-            extremes_method=self.extremes_method,
-            extremes_type=self.extremes_type,
-            block_size=self.extremes_kwargs.get("block_size", None),
+        observed_return_values = self._get_observed_return_values(
             return_period_size=return_period_size,
             plotting_position=plotting_position,
         )
@@ -1422,14 +1517,7 @@ def plot_return_values(
             )
         else:
             # Convert 'return_period' to ndarray
-            return_period = np.asarray(a=return_period, dtype=np.float64).copy()
-            if return_period.ndim == 0:
-                return_period = return_period[np.newaxis]
-            if return_period.ndim != 1:
-                raise ValueError(
-                    f"invalid shape in {return_period.shape} "
-                    f"for the 'return_period' argument, must be 1D array"
-                )
+            return_period = _normalize_return_period(return_period)
             if len(return_period) < 2:
                 raise ValueError(
                     f"'return_period' must have at least 2 return periods, "
@@ -1504,12 +1592,7 @@ def plot_probability(
 
         """
         # Get observed return values
-        observed_return_values = get_return_periods(
-            ts=self.data,
-            extremes=self.extremes,
-            extremes_method=self.extremes_method,
-            extremes_type=self.extremes_type,
-            block_size=self.extremes_kwargs.get("block_size", None),
+        observed_return_values = self._get_observed_return_values(
             return_period_size=return_period_size,
             plotting_position=plotting_position,
         )
@@ -1648,15 +1731,17 @@ def plot_diagnostic(
             ax_rv.grid(False, which="both")
 
             # Plot PDF
-            pdf_support = np.linspace(self.extremes.min(), self.extremes.max(), 100)
+            extremes_values = self.extremes.values
+            pdf_support = np.linspace(extremes_values.min(), extremes_values.max(), 100)
             pdf = self.model.pdf(self.extremes_transformer.transform(pdf_support))
+            bin_edges = np.histogram_bin_edges(a=extremes_values, bins="auto")
             ax_pdf.grid(False)
             ax_pdf.set_title("Probability density plot")
             ax_pdf.set_ylabel("Probability density")
             ax_pdf.set_xlabel(self.data.name)
             ax_pdf.hist(
-                self.extremes.values,
-                bins=np.histogram_bin_edges(a=self.extremes.values, bins="auto"),
+                extremes_values,
+                bins=bin_edges,
                 density=True,
                 rwidth=0.8,
                 facecolor="#5199FF",
@@ -1666,8 +1751,8 @@ def plot_diagnostic(
                 zorder=5,
             )
             ax_pdf.hist(
-                self.extremes.values,
-                bins=np.histogram_bin_edges(a=self.extremes.values, bins="auto"),
+                extremes_values,
+                bins=bin_edges,
                 density=True,
                 rwidth=0.8,
                 facecolor="None",
@@ -1678,8 +1763,8 @@ def plot_diagnostic(
             )
             ax_pdf.plot(pdf_support, pdf, color="#F85C50", lw=2, ls="-", zorder=15)
             ax_pdf.scatter(
-                self.extremes.values,
-                np.full(shape=len(self.extremes), fill_value=0),
+                extremes_values,
+                np.zeros(shape=len(extremes_values)),
                 marker="|",
                 s=40,
                 color="k",
@@ -121,13 +121,11 @@ def get_return_periods(
         )
 
     # Rank extreme values from most extreme (1) to least extreme (len(extremes))
+    # (all arithmetic below is done in-place on the array returned by 'rankdata')
+    ranks = scipy.stats.rankdata(extremes.values, method="average")
     if extremes_type == "high":
-        ranks = (
-            len(extremes) + 1 - scipy.stats.rankdata(extremes.values, method="average")
-        )
-    elif extremes_type == "low":
-        ranks = scipy.stats.rankdata(extremes.values, method="average")
-    else:
+        np.subtract(len(extremes) + 1, ranks, out=ranks)
+    elif extremes_type != "low":
         raise ValueError(
             f"invalid value in '{extremes_type}' for the 'extremes_type' argument"
         )
@@ -142,20 +140,22 @@ def get_return_periods(
         ) from _error
 
     # Calculate exceedance probabilities
-    exceedance_probability = (ranks - alpha) / (len(extremes) + 1 - alpha - beta)
+    exceedance_probability = ranks
+    exceedance_probability -= alpha
+    exceedance_probability /= len(extremes) + 1 - alpha - beta
 
     # Calculate return periods
-    return_periods = 1 / exceedance_probability / extremes_rate
-
-    # Copy `extremes` to make the returned DataFrame independent from the original
-    extremes = extremes.copy(deep=True)
+    return_periods = np.reciprocal(exceedance_probability)
+    return_periods /= extremes_rate
 
+    # The DataFrame constructor copies the values of `extremes`, but not its index -
+    # copy the index to make the returned DataFrame independent from `extremes`
     return pd.DataFrame(
         data={
             extremes.name: extremes.values,
             "exceedance probability": exceedance_probability,
             "return period": return_periods,
         },
-        index=extremes.index,
+        index=extremes.index.copy(),
         dtype=np.float64,
     )
@@ -181,3 +181,22 @@ def test_extremes_method_pot(
             assert np.argmin(return_periods.loc[:, extremes.name].values) == np.argmax(
                 return_periods.loc[:, "return period"].values
             )
+
+
+def test_get_return_periods_copy(battery_wl_preprocessed, extremes_bm_high):
+    extremes = extremes_bm_high.copy(deep=True)
+    return_periods = get_return_periods(
+        ts=battery_wl_preprocessed,
+        extremes=extremes,
+        extremes_method="BM",
+        extremes_type="high",
+        block_size="365.2425D",
+        return_period_size="365.2425D",
+        plotting_position="weibull",
+    )
+
+    # Ensure modifying the returned DataFrame doesn't affect `extremes`
+    return_periods.index.name = "renamed"
+    return_periods.iloc[0, 0] = -1
+    assert extremes.index.name == extremes_bm_high.index.name
+    assert np.all(extremes.values == extremes_bm_high.values)
@@ -1,3 +1,5 @@
+import warnings
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -124,6 +126,28 @@ def test_init_errors(self):
             assert np.allclose(eva_model.data.values, [1, 2, 3])
             assert np.allclose(eva_model.data.index.year.values, [2020, 2021, 2023])
 
+    @pytest.mark.parametrize("values", [[1.0, 2.0, 3.0], ["1", "2", "3"]])
+    def test_init_copies_data(self, values):
+        data = pd.Series(
+            data=values,
+            index=pd.DatetimeIndex(["2020", "2021", "2022"], name="date"),
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            eva_model = EVA(data=data)
+
+        # Ensure modifying the model data doesn't affect the original data
+        eva_model.data.iloc[0] = -1
+        eva_model.data.index.name = "renamed"
+        assert data.iloc[0] == values[0]
+        assert data.index.name == "date"
+
+        # Ensure modifying the original data doesn't affect the model
+        data.iloc[1] = -1
+        data.index.name = "original"
+        assert np.allclose(eva_model.data.values, [-1, 2, 3])
+        assert eva_model.data.index.name == "renamed"
+
     def test_init_attributes(self, eva_model):
         # Ensure that 'data' attribute is properly processed
         assert isinstance(eva_model.data, pd.Series)
@@ -350,6 +374,39 @@ def test_get_extremes_duplicate_indices(self):
         eva_model.get_extremes(method="BM")
         eva_model.get_extremes(method="POT", threshold=50)
 
+    def test_observed_return_values_cache(self, eva_model_pot):
+        observed_return_values = eva_model_pot._get_observed_return_values(
+            return_period_size="365.2425D", plotting_position="weibull"
+        )
+        assert len(observed_return_values) == len(eva_model_pot.extremes)
+
+        # Same arguments reuse cache (plotting position is not case-sensitive
+        # and return period size may be given as str or pandas.Timedelta)
+        cached_return_values = eva_model_pot._get_observed_return_values(
+            return_period_size="365.2425D", plotting_position="Weibull"
+        )
+        assert cached_return_values is observed_return_values
+        cached_return_values = eva_model_pot._get_observed_return_values(
+            return_period_size=pd.to_timedelta("365.2425D"),
+            plotting_position="weibull",
+        )
+        assert cached_return_values is observed_return_values
+
+        # Cache is reset when new extremes are extracted
+        eva_model_pot.get_extremes(method="POT", extremes_type="high", threshold=1.5)
+        assert len(eva_model_pot.extremes) < len(observed_return_values)
+        observed_return_values = eva_model_pot._get_observed_return_values(
+            return_period_size="365.2425D", plotting_position="weibull"
+        )
+        assert len(observed_return_values) == len(eva_model_pot.extremes)
+
+        # Cache is reset when extremes are set
+        eva_model_pot.set_extremes(eva_model_pot.extremes.iloc[:5], method="POT")
+        observed_return_values = eva_model_pot._get_observed_return_values(
+            return_period_size="365.2425D", plotting_position="weibull"
+        )
+        assert len(observed_return_values) == 5
+
     def test_from_extremes(self):
         index = pd.date_range(start="2000", end="2050", periods=100)
         eva_model = EVA.from_extremes(
@@ -585,6 +642,12 @@ def test_get_summary(self, eva_model_bm_mle, eva_model_pot_mle, extremes_method)
         assert isinstance(rv_summary, pd.DataFrame)
         assert len(rv_summary) == 2
 
+        # Test that index doesn't share memory with 'return_period'
+        return_period = np.array([10, 100], dtype=np.float64)
+        rv_summary = eva_model.get_summary(return_period=return_period)
+        return_period[:] = 0
+        assert np.all(rv_summary.index == [10, 100])
+
     @pytest.mark.parametrize("extremes_method", ["BM", "POT"])
     def test_test_ks(self, eva_model_bm_mle, eva_model_pot_mle, extremes_method):
         eva_model = {